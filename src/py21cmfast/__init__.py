@@ -17,7 +17,7 @@ except ModuleNotFoundError:  # pragma: no cover
 from os import mkdir as _mkdir
 from os import path
 
-from . import cache_tools, inputs, outputs, plotting, wrapper
+from . import cache_tools, inputs, outputs, wrapper
 from ._cfg import config
 from ._logging import configure_logging
 from .cache_tools import query_cache
@@ -53,6 +53,17 @@ from .wrapper import (
     spin_temperature,
 )
 
+
+def __getattr__(name):
+    # plotting pulls in matplotlib, which is slow to import and not needed to run
+    # simulations, so only import it on first access.
+    if name == "plotting":
+        import importlib
+
+        return importlib.import_module(f"{__name__}.plotting")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 configure_logging()
 
 try:
@@ -7,7 +7,6 @@ import warnings
 from abc import ABCMeta, abstractmethod
 from bidict import bidict
 from cffi import FFI
-from enum import IntEnum
 from hashlib import md5
 from os import makedirs, path
 from pathlib import Path
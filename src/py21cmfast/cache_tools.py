@@ -1,6 +1,5 @@
 """A set of tools for reading/writing/querying the in-built cache."""
 import glob
-import h5py
 import logging
 import os
 import re
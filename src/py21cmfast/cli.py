@@ -1,7 +1,6 @@
 """Module that contains the command line app."""
 import builtins
 import click
-import inspect
 import logging
 import matplotlib.pyplot as plt
 import numpy as np
@@ -862,12 +861,7 @@ def pr_feature(
         fig, ax = plt.subplots(2, 1, sharex=True)
         ax[0].set_yscale("log")
 
-        inds = [
-            np.where(np.abs(k - 0.1) == np.abs(k - 0.1).min())[0][0],
-            np.where(np.abs(k - 0.2) == np.abs(k - 0.2).min())[0][0],
-            np.where(np.abs(k - 0.5) == np.abs(k - 0.5).min())[0][0],
-            np.where(np.abs(k - 1) == np.abs(k - 1).min())[0][0],
-        ]
+        inds = [np.argmin(np.abs(k - kk)) for kk in (0.1, 0.2, 0.5, 1)]
 
         for i, (pdef, pnew, kk) in enumerate(
             zip(p_default[inds], p_new[inds], k[inds])
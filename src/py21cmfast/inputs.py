@@ -18,7 +18,6 @@ import contextlib
 import logging
 import warnings
 from astropy.cosmology import Planck15
-from os import path
 from pathlib import Path
 
 from ._cfg import config
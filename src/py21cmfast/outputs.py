@@ -22,7 +22,7 @@ from astropy.cosmology import z_at_value
 from cached_property import cached_property
 from hashlib import md5
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from typing import Sequence
 
 from . import __version__
 from . import _utils as _ut
@@ -1127,7 +1127,9 @@ class LightCone(_HighLevelOutput):
         self.cosmo_params = cosmo_params
         self.astro_params = astro_params
         self.flag_options = flag_options
-        self.node_redshifts = node_redshifts
+        self.node_redshifts = (
+            None if node_redshifts is None else np.asarray(node_redshifts)
+        )
         self.cache_files = cache_files
         self.log10_mturnovers = log10_mturnovers
         self.log10_mturnovers_mini = log10_mturnovers_mini
@@ -1197,7 +1199,7 @@ class LightCone(_HighLevelOutput):
             + self.lightcone_coords
         )
 
-    @property
+    @cached_property
     def lightcone_redshifts(self):
         """Redshift of each cell along the redshift axis."""
         return np.array(
@@ -7,11 +7,13 @@ from astropy import units as un
 from astropy.cosmology import z_at_value
 from matplotlib import colors
 from matplotlib.ticker import AutoLocator
-from typing import Optional, Union
 
 from . import outputs
 from .outputs import Coeval, LightCone
 
+# Rest-frame frequency of the 21cm line, in MHz.
+_NU21_MHZ = 1420
+
 eor_colour = colors.LinearSegmentedColormap.from_list(
     "EoR",
     [
@@ -348,7 +350,7 @@ def _set_zaxis_ticks(ax, lightcone, zticks, z_axis):
         if zticks == "redshift":
             coords = lc_z
         elif zticks == "frequency":
-            coords = 1420 / (1 + lc_z) * un.MHz
+            coords = _NU21_MHZ / (1 + lc_z) * un.MHz
         else:
             try:
                 coords = getattr(lightcone.cosmo_params.cosmo, zticks)(lc_z)
@@ -374,7 +376,7 @@ def _set_zaxis_ticks(ax, lightcone, zticks, z_axis):
         if zticks == "redshift":
             z_ticks = ticks
         elif zticks == "frequency":
-            z_ticks = 1420 / ticks - 1
+            z_ticks = _NU21_MHZ / ticks - 1
         else:
             z_ticks = [
                 z_at_value(getattr(lightcone.cosmo_params.cosmo, zticks), z * units)
@@ -89,7 +89,6 @@ from __future__ import annotations
 import logging
 import numpy as np
 import os
-import warnings
 from astropy import units
 from astropy.cosmology import z_at_value
 from copy import deepcopy
@@ -455,9 +454,10 @@ def compute_tau(*, redshifts, global_xHI, user_params=None, cosmo_params=None):
     if not np.all(np.diff(redshifts) > 0):
         raise ValueError("redshifts and global_xHI must be in ascending order")
 
-    # Convert the data to the right type
-    redshifts = np.array(redshifts, dtype="float32")
-    global_xHI = np.array(global_xHI, dtype="float32")
+    # Convert the data to the right type. The C code only reads these, so arrays that
+    # are already contiguous float32 are passed through without a copy.
+    redshifts = np.ascontiguousarray(redshifts, dtype="float32")
+    global_xHI = np.ascontiguousarray(global_xHI, dtype="float32")
 
     z = ffi.cast("float *", ffi.from_buffer(redshifts))
     xHI = ffi.cast("float *", ffi.from_buffer(global_xHI))
@@ -656,36 +656,27 @@ def compute_luminosity_function(
         lfunc_all.shape = (len(redshifts), nbins)
         Muvfunc_all.shape = (len(redshifts), nbins)
         Mhfunc_all.shape = (len(redshifts), nbins, 2)
+
+        # The common Muv grid is the same at every redshift, so build it once.
+        Muvfunc_all[:] = np.linspace(
+            min(Muvfunc.min(), Muvfunc_MINI.min()),
+            max(Muvfunc.max(), Muvfunc_MINI.max()),
+            nbins,
+        )
         for iz in range(len(redshifts)):
-            Muvfunc_all[iz] = np.linspace(
-                np.min([Muvfunc.min(), Muvfunc_MINI.min()]),
-                np.max([Muvfunc.max(), Muvfunc_MINI.max()]),
-                nbins,
-            )
-            lfunc_all[iz] = np.log10(
-                10
-                ** (
-                    interp1d(Muvfunc[iz], lfunc[iz], fill_value="extrapolate")(
-                        Muvfunc_all[iz]
-                    )
-                )
-                + 10
-                ** (
-                    interp1d(
-                        Muvfunc_MINI[iz], lfunc_MINI[iz], fill_value="extrapolate"
-                    )(Muvfunc_all[iz])
-                )
-            )
-            Mhfunc_all[iz] = np.array(
-                [
-                    interp1d(Muvfunc[iz], Mhfunc[iz], fill_value="extrapolate")(
-                        Muvfunc_all[iz]
-                    ),
-                    interp1d(
-                        Muvfunc_MINI[iz], Mhfunc_MINI[iz], fill_value="extrapolate"
-                    )(Muvfunc_all[iz]),
-                ],
-            ).T
+            # The LF and halo mass share their Muv abscissa, so interpolate both
+            # with a single interpolator per component.
+            lf_acg, mh_acg = interp1d(
+                Muvfunc[iz], [lfunc[iz], Mhfunc[iz]], fill_value="extrapolate"
+            )(Muvfunc_all[iz])
+            lf_mcg, mh_mcg = interp1d(
+                Muvfunc_MINI[iz],
+                [lfunc_MINI[iz], Mhfunc_MINI[iz]],
+                fill_value="extrapolate",
+            )(Muvfunc_all[iz])
+
+            lfunc_all[iz] = np.log10(10**lf_acg + 10**lf_mcg)
+            Mhfunc_all[iz] = np.array([mh_acg, mh_mcg]).T
         lfunc_all[lfunc_all <= -30] = np.nan
         return Muvfunc_all, Mhfunc_all, lfunc_all
     elif component == 1:
@@ -2906,17 +2897,25 @@ def run_lightcone(
 
             # Interpolate the lightcone
             if z < max_redshift:
+                # The cells to fill on this step are the same for every quantity.
+                # lc_distances is sorted, so the cells in [this_d, prev_d) are a slice.
+                prev_d = scroll_distances[iz - 1]
+                this_d = scroll_distances[iz]
+                lo, hi = np.searchsorted(lc_distances, [this_d, prev_d])
+                these_distances = lc_distances[lo:hi]
+                n = len(these_distances)
+
                 for quantity in lightcone_quantities:
                     data1, data2 = outs[_fld_names[quantity]]
                     fnc = interp_functions.get(quantity, "mean")
 
-                    n = _interpolate_in_redshift(
-                        iz,
+                    _interpolate_in_redshift(
                         box_index,
                         lc_index,
                         n_lightcone,
-                        scroll_distances,
-                        lc_distances,
+                        prev_d,
+                        this_d,
+                        these_distances,
                         data1,
                         data2,
                         quantity,
@@ -2993,10 +2992,11 @@ def _get_coeval_callbacks(
     compute_coeval_callback = [False for i in range(len(scrollz))]
     if coeval_callback is not None:
         if isinstance(coeval_callback_redshifts, (list, np.ndarray)):
+            scrollz_arr = np.asarray(scrollz)
             for coeval_z in coeval_callback_redshifts:
                 assert isinstance(coeval_z, (int, float, np.number))
                 compute_coeval_callback[
-                    np.argmin(np.abs(np.array(scrollz) - coeval_z))
+                    np.argmin(np.abs(scrollz_arr - coeval_z))
                 ] = True
             if sum(compute_coeval_callback) != len(coeval_callback_redshifts):
                 logger.warning(
@@ -3045,12 +3045,12 @@ def _get_interpolation_outputs(
 
 
 def _interpolate_in_redshift(
-    z_index,
     box_index,
     lc_index,
     n_lightcone,
-    scroll_distances,
-    lc_distances,
+    prev_d,
+    this_d,
+    these_distances,
     output_obj,
     output_obj2,
     quantity,
@@ -3068,24 +3068,24 @@ def _interpolate_in_redshift(
     assert array.__class__ == array2.__class__
 
     # Do linear interpolation only.
-    prev_d = scroll_distances[z_index - 1]
-    this_d = scroll_distances[z_index]
-
-    # Get the cells that need to be filled on this iteration.
-    these_distances = lc_distances[
-        np.logical_and(lc_distances < prev_d, lc_distances >= this_d)
-    ]
-
     n = len(these_distances)
-    ind = np.arange(-(box_index + n), -box_index)
 
-    sub_array = array.take(ind + n_lightcone, axis=2, mode="wrap")
-    sub_array2 = array2.take(ind + n_lightcone, axis=2, mode="wrap")
-
-    out = (
-        np.abs(this_d - these_distances) * sub_array
-        + np.abs(prev_d - these_distances) * sub_array2
-    ) / (np.abs(prev_d - this_d))
+    # Unless the required slices wrap around the end of the box, a basic slice gives
+    # a view rather than copying them out of both boxes.
+    start = (n_lightcone - box_index - n) % array.shape[2]
+    if start + n <= array.shape[2]:
+        sub_array = array[:, :, start : start + n]
+        sub_array2 = array2[:, :, start : start + n]
+    else:
+        ind = np.arange(-(box_index + n), -box_index)
+        sub_array = array.take(ind + n_lightcone, axis=2, mode="wrap")
+        sub_array2 = array2.take(ind + n_lightcone, axis=2, mode="wrap")
+
+    # The weights only vary along the line of sight, so form them in 1D and accumulate
+    # in place instead of creating several full-size temporaries.
+    delta_d = np.abs(prev_d - this_d)
+    out = sub_array * (np.abs(this_d - these_distances) / delta_d)
+    out += sub_array2 * (np.abs(prev_d - these_distances) / delta_d)
     if kind == "mean_max":
         flag = sub_array * sub_array2 < 0
         out[flag] = np.maximum(sub_array, sub_array2)[flag]
@@ -3093,7 +3093,6 @@ def _interpolate_in_redshift(
         raise ValueError("kind must be 'mean' or 'mean_max'")
 
     lc[:, :, -(lc_index + n) : n_lightcone - lc_index] = out
-    return n
 
 
 def _setup_lightcone(
@@ -236,6 +236,7 @@ def test_lightcone(lc, default_user_params, redshift, max_redshift):
     assert lc.lightcone_redshifts[-1] >= max_redshift
     assert np.isclose(lc.lightcone_redshifts[0], redshift, atol=1e-4)
     assert lc.cell_size == default_user_params.BOX_LEN / default_user_params.HII_DIM
+    assert isinstance(lc.node_redshifts, np.ndarray)
 
 
 def test_lightcone_quantities(ic, max_redshift, perturb_field):